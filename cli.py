@@ -0,0 +1,199 @@
+# cli.py
+
+import argparse
+import json
+import os
+import random
+import sys
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# Headless entry point: nothing in here (or in core/) may import PyQt6.
+from core.logger import logger
+from core.audit_log import audit_log
+from core.config_manager import config_manager
+from core.bracket_logic import BracketLogic
+from core.player_manager import PlayerManager
+from core.prize_logic import prize_logic
+from core.models import TournamentStateModel, TournamentPhase, MatchStatus
+
+# File names expected inside each tournament directory for batch runs
+ROSTER_FILE = 'roster.json'
+RESULTS_FILE = 'results.json'
+OUTPUT_FILE = 'standings.json'
+
+def load_roster(path: Path) -> Tuple[str, List[Dict[str, Optional[str]]]]:
+    """
+    Reads a roster file. Accepts either a bare list of players or
+    {"name": ..., "players": [...]}; each player is a name string or {"name": ..., "email": ...}.
+    """
+    data = json.loads(path.read_text())
+    if isinstance(data, dict):
+        name = data.get("name", path.parent.name)
+        entries = data["players"]
+    else:
+        name = path.parent.name
+        entries = data
+    if not isinstance(entries, list):
+        raise ValueError(f"Roster {path} must contain a list of players.")
+
+    players = []
+    for entry in entries:
+        if isinstance(entry, str):
+            entry = {"name": entry}
+        if not isinstance(entry, dict) or not isinstance(entry.get("name"), str):
+            raise ValueError(f"Roster {path} has an invalid player entry: {entry!r}")
+        players.append(entry)
+    return name, players
+
+def load_results(path: Path) -> List[str]:
+    """Reads a results file: an ordered list of winner names (strings or {"winner": name})."""
+    data = json.loads(path.read_text())
+    return [e if isinstance(e, str) else e["winner"] for e in data]
+
+def run_tournament(roster_path: Path, results_path: Optional[Path] = None, seed: Optional[int] = None) -> dict:
+    """
+    Runs a single tournament headlessly: registers the roster, generates the bracket,
+    applies each result to the active match in order and returns the JSON report.
+    """
+    name, entries = load_roster(roster_path)
+    if seed is not None:
+        random.seed(seed)
+
+    # 1. Register players with a manager private to this tournament
+    manager = PlayerManager()
+    for entry in entries:
+        manager.register_new_player(entry["name"], entry.get("email"))
+    roster = manager.get_all_players()
+
+    ids_by_name = {p.name: p.player_id for p in roster}
+    if len(ids_by_name) != len(roster):
+        raise ValueError(f"Roster for '{name}' contains duplicate player names.")
+
+    # 2. Generate the bracket
+    logic = BracketLogic()
+    state = TournamentStateModel(
+        tournament_id=str(uuid.uuid4()),
+        name=name,
+        players={p.player_id: p for p in roster}
+    )
+    state = logic.start_tournament(state, roster)
+    if state.phase != TournamentPhase.IN_PROGRESS:
+        raise ValueError(f"Could not start '{name}' with {len(roster)} players.")
+
+    # 3. Apply results to the active match, in order
+    winners = load_results(results_path) if results_path else []
+    active = state.active_match()
+    active_id = active.match_id if active else None
+    for winner in winners:
+        if active_id is None:
+            raise ValueError(f"'{name}' has more results than matches (stopped at '{winner}').")
+        if winner not in ids_by_name:
+            raise ValueError(f"Result '{winner}' is not a player on the roster for '{name}'.")
+        state, next_id = logic.record_match_result(state, active_id, ids_by_name[winner])
+        if state.bracket[active_id].status != MatchStatus.COMPLETE:
+            teams = [state.players[p_id].name for p_id in state.bracket[active_id].teams]
+            raise ValueError(f"Result '{winner}' is not a player in the active match ({teams[0]} vs {teams[1]}).")
+        active_id = next_id
+
+    return build_report(state, logic)
+
+def build_report(state: TournamentStateModel, logic: BracketLogic) -> dict:
+    """Builds the JSON-serializable standings and payouts report for a tournament state."""
+    standings = logic.get_standings(state)
+    payouts = prize_logic.compute_payouts(state, standings) if state.phase == TournamentPhase.FINALIZED else {}
+
+    return {
+        "tournament_id": state.tournament_id,
+        "name": state.name,
+        "phase": state.phase.value,
+        "total_prize_pool": state.total_prize_pool,
+        "matches_played": sum(1 for m in state.bracket.values() if m.status == MatchStatus.COMPLETE),
+        "standings": [
+            {"place": place, "player_id": p_id, "name": state.players[p_id].name}
+            for place, p_id in standings
+        ],
+        "payouts": [
+            {"player_id": p_id, "name": state.players[p_id].name, "amount": amount}
+            for p_id, amount in payouts.items()
+        ],
+    }
+
+def _use_config(config_path: Optional[Path]):
+    """Points the shared ConfigManager at an alternate config file."""
+    if config_path:
+        config_manager.config_path = config_path
+        config_manager.load_config()
+
+def run_tournament_dir(directory: Path, seed: Optional[int] = None, config_path: Optional[Path] = None) -> dict:
+    """Batch worker: runs the tournament in ``directory`` and writes its standings file there."""
+    _use_config(config_path)
+    results_path = directory / RESULTS_FILE
+    try:
+        report = run_tournament(
+            directory / ROSTER_FILE,
+            results_path if results_path.exists() else None,
+            seed
+        )
+    except Exception as e:
+        # One malformed directory must not abort the rest of the batch.
+        logger.error(f"Failed to process tournament in {directory}: {e}")
+        return {"directory": str(directory), "error": str(e)}
+    finally:
+        # Pool workers exit without running atexit hooks, so drain the audit queue here.
+        audit_log.flush()
+
+    (directory / OUTPUT_FILE).write_text(json.dumps(report, indent=4))
+    return {"directory": str(directory), **report}
+
+def run_batch(root: Path, workers: Optional[int] = None, seed: Optional[int] = None, config_path: Optional[Path] = None) -> List[dict]:
+    """Processes every sub-directory of ``root`` containing a roster, in parallel across processes."""
+    directories = sorted(d for d in root.iterdir() if (d / ROSTER_FILE).is_file())
+    logger.info(f"Processing {len(directories)} tournaments from {root} with {workers or os.cpu_count()} workers.")
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(run_tournament_dir, directories, repeat(seed), repeat(config_path)))
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Run BracketLab tournaments without the GUI.")
+    parser.add_argument("--config", type=Path, help="Alternate config.json to use.")
+    parser.add_argument("--seed", type=int, help="Random seed for bracket seeding (reproducible draws).")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="Run a single tournament.")
+    run.add_argument("roster", type=Path, help="Roster JSON file.")
+    run.add_argument("--results", type=Path, help="Results JSON file (ordered list of winners).")
+    run.add_argument("--output", type=Path, help="Write the report here instead of stdout.")
+
+    batch = commands.add_parser("batch", help=f"Run every tournament directory (containing {ROSTER_FILE}) under a root.")
+    batch.add_argument("root", type=Path, help="Directory of tournament directories.")
+    batch.add_argument("--workers", type=int, help="Worker processes (defaults to the CPU count).")
+    return parser
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Parses arguments and runs the requested headless command. Returns the exit code."""
+    args = _build_parser().parse_args(argv)
+    _use_config(args.config)
+
+    if args.command == "run":
+        try:
+            report = run_tournament(args.roster, args.results, args.seed)
+        except (OSError, KeyError, ValueError) as e:
+            logger.error(f"Failed to process tournament {args.roster}: {e}")
+            return 1
+        output = json.dumps(report, indent=4)
+        if args.output:
+            args.output.write_text(output)
+        else:
+            print(output)
+        return 0
+
+    reports = run_batch(args.root, args.workers, args.seed, args.config)
+    print(json.dumps(reports, indent=4))
+    return 1 if any("error" in r for r in reports) else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,234 @@
+# core/audit_log.py
+
+import atexit
+import gzip
+import json
+import os
+import queue
+import re
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from core.config_manager import config_manager
+from core.logger import LOG_DIR, logger
+
+# --- Setup Audit Paths ---
+AUDIT_DIR = LOG_DIR / 'audit'
+AUDIT_ROTATION_BYTES = 10 * 1024 * 1024 # Matches the 10 MB rotation of the main log
+
+# Tournament ids become file names and glob patterns, so only plain names are accepted
+# (no separators, dots or glob metacharacters). uuid4 ids always qualify.
+SAFE_TOURNAMENT_ID = re.compile(r'[A-Za-z0-9_-]+')
+
+class AuditLog:
+    """
+    Per-tournament structured audit streams written by a background thread.
+
+    ``record`` only enqueues onto a bounded queue (blocking when it is full, so a
+    runaway producer is throttled rather than growing memory). The writer thread
+    drains records in batches and appends JSON lines to ``<tournament_id>.jsonl``;
+    rotated segments are gzipped on a separate compressor thread.
+    """
+
+    def __init__(self, audit_dir: Path = AUDIT_DIR, queue_size: Optional[int] = None, batch_size: Optional[int] = None,
+                 rotation_bytes: int = AUDIT_ROTATION_BYTES, enabled: Optional[bool] = None):
+        # Settings left as None follow the config (audit_enabled, audit_queue_size,
+        # audit_batch_size) as it stands when the writer starts, so a reloaded config applies.
+        self.audit_dir = audit_dir
+        self.enabled = enabled
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.rotation_bytes = rotation_bytes
+
+        self._queue: Optional[queue.Queue] = None
+        self._batch_size = 0
+        self._writer: Optional[threading.Thread] = None
+        self._compressor: Optional[ThreadPoolExecutor] = None
+        self._pid: Optional[int] = None
+        self._start_lock = threading.Lock()
+        # Held while a stream is appended to or rotated, and while a query reads it,
+        # so a query never lists segments from before a rotation it then misses.
+        self._stream_lock = threading.Lock()
+        atexit.register(self.close)
+
+    # --- PRODUCER SIDE (hot path) ---
+
+    def record(self, tournament_id: str, event: str, match_id: Optional[str] = None, **data: Any):
+        """Queues one audit record. Blocks only when the writer has fallen a full queue behind."""
+        if not self.is_enabled():
+            return
+        self._check_tournament_id(tournament_id)
+        self._ensure_started()
+        self._queue.put({
+            "ts": time.time(),
+            "tournament_id": tournament_id,
+            "match_id": match_id,
+            "event": event,
+            **data,
+        })
+
+    def flush(self):
+        """Blocks until every record queued so far has been written to disk."""
+        if not self._running():
+            return
+        marker = threading.Event()
+        self._queue.put(marker)
+        marker.wait()
+
+    def close(self):
+        """Flushes, stops the writer and waits for pending compression."""
+        if not self._running():
+            return
+        self._queue.put(None)
+        self._writer.join()
+        self._compressor.shutdown(wait=True)
+        self._writer = None
+
+    def is_enabled(self) -> bool:
+        return self.enabled if self.enabled is not None else config_manager.config.audit_enabled
+
+    def _running(self) -> bool:
+        # A dead writer (or one inherited through fork) counts as stopped and is restarted.
+        return self._writer is not None and self._pid == os.getpid() and self._writer.is_alive()
+
+    def _ensure_started(self):
+        """Starts the writer lazily (and again in forked worker processes, where threads do not survive)."""
+        if self._running():
+            return
+        with self._start_lock:
+            if self._running():
+                return
+            self.audit_dir.mkdir(parents=True, exist_ok=True)
+            config = config_manager.config
+            self._batch_size = self.batch_size or config.audit_batch_size
+            self._queue = queue.Queue(maxsize=self.queue_size or config.audit_queue_size)
+            self._compressor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="audit-compress")
+            self._writer = threading.Thread(target=self._run, name="audit-writer", daemon=True)
+            self._pid = os.getpid()
+            self._writer.start()
+
+    # --- WRITER SIDE (background thread) ---
+
+    def _run(self):
+        """Drains the queue in batches until the stop sentinel arrives."""
+        while True:
+            batch: List[Dict[str, Any]] = []
+            markers: List[threading.Event] = []
+            stop = False
+
+            item = self._queue.get()
+            while True:
+                if item is None:
+                    stop = True
+                elif isinstance(item, threading.Event):
+                    markers.append(item)
+                else:
+                    batch.append(item)
+                if stop or len(batch) >= self._batch_size:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+
+            try:
+                self._write_batch(batch)
+            except Exception as e:
+                # Never let one bad batch kill the writer: flush()/query() wait on its markers.
+                logger.error(f"Audit writer failed to persist {len(batch)} records: {e}")
+            finally:
+                for marker in markers:
+                    marker.set()
+            if stop:
+                return
+
+    def _write_batch(self, batch: List[Dict[str, Any]]):
+        """Appends a batch to each tournament's stream, rotating streams that grew too large."""
+        by_tournament: Dict[str, List[str]] = {}
+        for rec in batch:
+            by_tournament.setdefault(rec["tournament_id"], []).append(json.dumps(rec, default=str))
+
+        for tournament_id, lines in by_tournament.items():
+            path = self._stream_path(tournament_id)
+            with self._stream_lock:
+                with path.open('a', encoding='utf-8') as stream:
+                    stream.write("\n".join(lines) + "\n")
+                    size = stream.tell()
+                if size >= self.rotation_bytes:
+                    self._rotate(tournament_id, path)
+
+    def _rotate(self, tournament_id: str, path: Path):
+        """
+        Moves the live stream aside as the next numbered segment and compresses it off-thread.
+        Called with ``_stream_lock`` held.
+        """
+        segment = self.audit_dir / f"{tournament_id}.{len(self._segments(tournament_id)):06d}.jsonl"
+        path.rename(segment)
+        self._compressor.submit(self._compress, segment)
+
+    @staticmethod
+    def _compress(segment: Path):
+        """Gzips a rotated segment next to itself, then removes the plain copy."""
+        tmp_path = segment.with_name(segment.name + '.gz.tmp')
+        with segment.open('rb') as src, gzip.open(tmp_path, 'wb') as dst:
+            shutil.copyfileobj(src, dst)
+        os.replace(tmp_path, segment.with_name(segment.name + '.gz'))
+        segment.unlink()
+
+    # --- QUERIES ---
+
+    @staticmethod
+    def _check_tournament_id(tournament_id: str):
+        """Raises ValueError for ids that are not safe to use as a file name and glob prefix."""
+        if not isinstance(tournament_id, str) or not SAFE_TOURNAMENT_ID.fullmatch(tournament_id):
+            raise ValueError(f"Tournament id {tournament_id!r} cannot be used for an audit stream.")
+
+    def _stream_path(self, tournament_id: str) -> Path:
+        return self.audit_dir / f"{tournament_id}.jsonl"
+
+    def _segments(self, tournament_id: str) -> List[Path]:
+        """Rotated segments (plain or gzipped) in write order, without duplicates."""
+        names = set()
+        for path in self.audit_dir.glob(f"{tournament_id}.*.jsonl*"):
+            if not path.name.endswith('.tmp'):
+                names.add(path.name.removesuffix('.gz'))
+        return [self.audit_dir / name for name in sorted(names)]
+
+    def query(self, tournament_id: str, match_id: Optional[str] = None, event: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Returns a tournament's audit records in order, optionally filtered by match and event."""
+        self._check_tournament_id(tournament_id)
+        self.flush()
+
+        with self._stream_lock:
+            lines: List[str] = []
+            for path in self._segments(tournament_id) + [self._stream_path(tournament_id)]:
+                lines.extend(self._read_lines(path))
+
+        records: List[Dict[str, Any]] = []
+        for line in lines:
+            rec = json.loads(line)
+            if match_id is not None and rec["match_id"] != match_id:
+                continue
+            if event is not None and rec["event"] != event:
+                continue
+            records.append(rec)
+        return records
+
+    @staticmethod
+    def _read_lines(path: Path) -> List[str]:
+        """Reads a segment, falling back to its gzipped form if compression moved it meanwhile."""
+        gz_path = path.with_name(path.name + '.gz')
+        try:
+            return path.read_text(encoding='utf-8').splitlines()
+        except FileNotFoundError:
+            if not gz_path.exists():
+                return []
+            with gzip.open(gz_path, 'rt', encoding='utf-8') as stream:
+                return stream.read().splitlines()
+
+# Initialization for use across the application
+audit_log = AuditLog()
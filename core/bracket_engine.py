@@ -0,0 +1,157 @@
+# core/bracket_engine.py
+
+import heapq
+from array import array
+from math import ceil, log2
+from typing import Dict, List
+
+from core.bracket_table import BracketTable, PENDING, ACTIVE, COMPLETE, NO_PLAYER, NO_MATCH
+from core.models import TournamentStateModel
+
+
+class BracketEngine:
+    """
+    Bracket operations over a BracketTable, used internally by BracketLogic.
+
+    The table is shared with ``TournamentStateModel.bracket_table`` and is the only copy of
+    the bracket. The engine only adds lookups derived from it (player index, each player's
+    current match, a heap of playable matches), so an evicted engine is rebuilt from the
+    table without replaying any results.
+    """
+
+    __slots__ = ("tournament_id", "table", "player_ids", "player_index", "current_match", "_ready")
+
+    def __init__(self, tournament_id: str, seeding: List[str], table: BracketTable):
+        """Attaches to an existing table. Raises ValueError if it was not built for ``seeding``."""
+        if table.num_players != len(seeding):
+            raise ValueError(
+                f"Bracket of tournament {tournament_id} was drawn for {table.num_players} players "
+                f"but the seeding lists {len(seeding)}."
+            )
+        self.tournament_id = tournament_id
+        self.table = table
+        self.player_ids = seeding
+        self.player_index: Dict[str, int] = {p_id: i for i, p_id in enumerate(seeding)}
+        self.current_match = array('i', [NO_MATCH]) * len(seeding)
+        self._ready: List[int] = []
+
+        for m in range(table.num_matches):
+            if table.status[m] == COMPLETE:
+                continue
+            for player in (table.team_a[m], table.team_b[m]):
+                if player != NO_PLAYER:
+                    self.current_match[player] = m
+            if table.status[m] == PENDING and table.is_published(m):
+                self._ready.append(m) # ascending, so already a valid heap
+
+    @classmethod
+    def create(cls, tournament_id: str, seeding: List[str]) -> "BracketEngine":
+        """
+        Builds the full bracket tree for the given draw order.
+
+        The first ``bracket_size - len(seeding)`` players receive byes and are placed
+        directly into Round 2; the remaining players are paired in order for Round 1.
+        """
+        num_players = len(seeding)
+        if num_players < 2:
+            return cls(tournament_id, seeding, BracketTable(num_players, 0))
+
+        bracket_size = 2 ** ceil(log2(num_players))
+        num_byes = bracket_size - num_players
+        first_round_slots = bracket_size // 2
+        num_first_round = first_round_slots - num_byes
+
+        # Round 2 onwards is always a full tree: first_round_slots - 1 matches.
+        engine = cls(tournament_id, seeding, BracketTable(num_players, num_first_round + first_round_slots - 1))
+        table = engine.table
+
+        # Lay out rounds: Round 1 first, then each later round, the final last.
+        round_start = [0, num_first_round]
+        round_size = first_round_slots // 2
+        round_no = 2
+        while round_size >= 1:
+            for j in range(round_size):
+                table.round_no[round_start[-1] + j] = round_no
+            round_start.append(round_start[-1] + round_size)
+            round_size //= 2
+            round_no += 1
+
+        # Link later rounds to their parents.
+        for r in range(1, len(round_start) - 2):
+            for j in range(round_start[r + 1] - round_start[r]):
+                table.next_match[round_start[r] + j] = round_start[r + 1] + j // 2
+                table.next_slot[round_start[r] + j] = j % 2
+
+        # Round 1 slots: real matches take the even slots first so byes are spread
+        # across Round 2 rather than meeting each other.
+        slot_order = list(range(0, first_round_slots, 2)) + list(range(1, first_round_slots, 2))
+        bye_players = list(range(num_byes))
+        match_players = list(range(num_byes, num_players))
+
+        for m, slot in enumerate(slot_order[:num_first_round]):
+            table.round_no[m] = 1
+            if first_round_slots > 1:
+                table.next_match[m] = round_start[1] + slot // 2
+                table.next_slot[m] = slot % 2
+            engine._place(m, 0, match_players[2 * m])
+            engine._place(m, 1, match_players[2 * m + 1])
+
+        for player, slot in zip(bye_players, slot_order[num_first_round:]):
+            engine._place(round_start[1] + slot // 2, slot % 2, player)
+
+        # Everything published by the draw is listed in bracket order.
+        table.published = array('i', sorted(table.published))
+        return engine
+
+    @classmethod
+    def from_state(cls, state: TournamentStateModel) -> "BracketEngine":
+        """Attaches to the table of a state model (e.g. one loaded from disk). Raises ValueError if it has none."""
+        if state.bracket_table is None:
+            raise ValueError(f"Tournament {state.tournament_id} has no bracket.")
+        return cls(state.tournament_id, state.seeding, state.bracket_table)
+
+    def is_view_of(self, state: TournamentStateModel) -> bool:
+        """True if ``state`` still holds the very table and seeding this engine indexes."""
+        return state.bracket_table is self.table and state.seeding is self.player_ids
+
+    # --- CORE OPERATIONS ---
+
+    def _place(self, m: int, slot: int, player: int):
+        """Puts a player into a match slot, publishing the match once both are known."""
+        table = self.table
+        if slot == 0:
+            table.team_a[m] = player
+        else:
+            table.team_b[m] = player
+        self.current_match[player] = m
+
+        if table.is_published(m):
+            table.published.append(m)
+            heapq.heappush(self._ready, m)
+
+    def complete(self, m: int, winner: int):
+        """Marks match ``m`` won by ``winner`` and advances the winner."""
+        table = self.table
+        table.status[m] = COMPLETE
+        table.winner[m] = winner
+        if table.active == m:
+            table.active = NO_MATCH
+
+        self.current_match[table.loser(m)] = NO_MATCH
+
+        parent = table.next_match[m]
+        if parent == NO_MATCH:
+            self.current_match[winner] = NO_MATCH
+        else:
+            self._place(parent, table.next_slot[m], winner)
+
+    def activate_next(self) -> int:
+        """Activates the lowest-indexed playable match. Returns its index or NO_MATCH."""
+        table = self.table
+        while self._ready:
+            m = heapq.heappop(self._ready)
+            if table.status[m] == PENDING:
+                table.status[m] = ACTIVE
+                table.active = m
+                return m
+        return NO_MATCH
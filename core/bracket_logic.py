@@ -1,21 +1,32 @@
 # core/bracket_logic.py
 
-import uuid
 import random
+from collections import OrderedDict
 # Ensure this line correctly imports ALL necessary types, including Optional
-from typing import List, Dict, Tuple, Optional 
+from typing import List, Tuple, Optional 
 
 from core.models import (
-    TournamentStateModel, MatchModel, MatchStatus, TournamentPhase, PlayerModel
+    TournamentStateModel, TournamentPhase, PlayerModel
 )
+from core.bracket_engine import BracketEngine
+from core.bracket_table import ACTIVE, COMPLETE, NO_MATCH, NO_PLAYER
 from core.config_manager import config_manager
 from core.logger import logger
+from core.audit_log import audit_log
 from math import log2, ceil
 
+# Upper bound on engines kept in memory between results
+MAX_CACHED_ENGINES = 256
+
 class BracketLogic:
     """Encapsulates all core business logic for bracket management."""
 
-    def __init__(self):
+    def __init__(self, max_cached_engines: int = MAX_CACHED_ENGINES):
+        # Live engines keyed by tournament_id, least recently used first. An engine lives
+        # until its tournament finalizes, release_tournament is called, or it is evicted;
+        # an evicted engine is simply re-attached to the state's table on its next result.
+        self._engines: "OrderedDict[str, BracketEngine]" = OrderedDict()
+        self.max_cached_engines = max_cached_engines
         logger.info("BracketLogic initialized.")
 
     def _determine_bracket_size(self, num_players: int) -> int:
@@ -44,81 +55,137 @@ class BracketLogic:
         # 3. Seeding (Simple Random Seeding)
         player_ids = [p.player_id for p in players]
         random.shuffle(player_ids)
+        state.seeding = player_ids
         
         # 4. Bracket Generation (Single Elimination)
-        bracket_size = self._determine_bracket_size(num_players)
-        matches: Dict[str, MatchModel] = {}
-        
-        num_byes = bracket_size - num_players
-        
-        # Determine players who get byes (if any)
-        bye_players = player_ids[:num_byes]
-        match_players = player_ids[num_byes:] # Remaining players compete in Round 1
+        # The state keeps only the compact table; MatchModels are built when read.
+        engine = BracketEngine.create(state.tournament_id, state.seeding)
+        engine.activate_next()
+        state.bracket_table = engine.table
+        self._cache_engine(engine)
         
-        # Create first round matches
-        match_counter = 0
-        while len(match_players) >= 2:
-            match_id = str(uuid.uuid4())
-            team_A = match_players.pop(0)
-            team_B = match_players.pop(0)
-            
-            matches[match_id] = MatchModel(
-                match_id=match_id,
-                round_name="Round 1",
-                teams=[team_A, team_B],
-                status=MatchStatus.ACTIVE if match_counter == 0 else MatchStatus.PENDING
-            )
-            match_counter += 1
-            
+        num_byes = self._determine_bracket_size(num_players) - num_players
         logger.info(f"Tournament started with {num_players} players. {num_byes} byes generated.")
-        # NOTE: Handling byes (advancing them to round 2) would be a complex feature added here.
         
-        state.bracket = matches
-        return state.model_copy(deep=True) # Return a modified copy of the state
+        audit_log.record(state.tournament_id, "tournament_started", players=num_players, byes=num_byes)
+        if engine.table.active != NO_MATCH:
+            audit_log.record(state.tournament_id, "match_activated", engine.table.match_id(engine.table.active))
+        return state
+
+    def _engine_for(self, state: TournamentStateModel) -> Optional[BracketEngine]:
+        """Returns the cached engine for this state, rebuilding it if the state holds a different table."""
+        engine = self._engines.get(state.tournament_id)
+        if engine is None or not engine.is_view_of(state):
+            engine = self._rebuild_engine(state)
+            if engine is not None:
+                self._cache_engine(engine)
+        else:
+            self._engines.move_to_end(state.tournament_id)
+        return engine
+
+    def _cache_engine(self, engine: BracketEngine):
+        """Stores an engine as most recently used, evicting the oldest beyond the cap."""
+        self._engines[engine.tournament_id] = engine
+        self._engines.move_to_end(engine.tournament_id)
+        while len(self._engines) > self.max_cached_engines:
+            evicted_id, _ = self._engines.popitem(last=False)
+            logger.debug(f"Evicted bracket engine for tournament {evicted_id}.")
+
+    def release_tournament(self, tournament_id: str):
+        """Drops the cached engine for an abandoned tournament (a no-op if none is cached)."""
+        self._engines.pop(tournament_id, None)
+
+    def _rebuild_engine(self, state: TournamentStateModel) -> Optional[BracketEngine]:
+        """Rebuilds an engine from the state's table, logging and returning None if it does not fit the seeding."""
+        try:
+            return BracketEngine.from_state(state)
+        except ValueError as e:
+            logger.error(f"Cannot load bracket for tournament {state.tournament_id}: {e}")
+            return None
 
     def record_match_result(self, state: TournamentStateModel, match_id: str, winner_id: str) -> Tuple[TournamentStateModel, Optional[str]]:
         """
         Records the winner of a match and manages state transition.
         Returns the updated state and the ID of the next match (or None).
         """
-        if match_id not in state.bracket:
+        table = state.bracket_table
+        m = table.index_of(match_id) if table is not None else NO_MATCH
+        if m == NO_MATCH:
             logger.warning(f"Attempted to record result for non-existent match: {match_id}")
             return state, None
         
-        match = state.bracket[match_id]
+        engine = self._engine_for(state)
+        if engine is None:
+            return state, None
+        winner = engine.player_index.get(winner_id, NO_PLAYER)
         
         # 1. Validation and Update current match
-        if match.status != MatchStatus.ACTIVE or winner_id not in match.teams:
-            logger.error(f"Invalid result for match {match_id}. Winner: {winner_id}, Status: {match.status.value}")
+        if table.status[m] != ACTIVE or winner == NO_PLAYER or winner not in (table.team_a[m], table.team_b[m]):
+            logger.error(f"Invalid result for match {match_id}. Winner: {winner_id}, Status: {state.bracket[match_id].status.value}")
             return state, None
 
-        match.status = MatchStatus.COMPLETE
-        match.winner_id = winner_id
-        match.loser_id = next(p for p in match.teams if p != winner_id)
+        # 2. Advance Winner into its next-round slot (written straight into the state's table)
+        engine.complete(m, winner)
         
-        logger.info(f"Match {match_id} completed. Winner: {winner_id}")
+        # Per-match detail goes to the audit stream; the main log only keeps it at DEBUG.
+        logger.debug(f"Match {match_id} completed. Winner: {winner_id}")
+        audit_log.record(
+            state.tournament_id, "match_completed", match_id,
+            winner_id=winner_id, loser_id=engine.player_ids[table.loser(m)]
+        )
 
-        # 2. Advance Winner (Placeholder for complex bracket advancement)
-        # This is where the core logic to find the next match and insert the winner would go.
-        
         # 3. Activate the next available match
-        next_match_id = next((m_id for m_id, m in state.bracket.items() 
-                             if m.status == MatchStatus.PENDING), None)
-        
-        if next_match_id:
-            state.bracket[next_match_id].status = MatchStatus.ACTIVE
-            logger.info(f"Next match activated: {next_match_id}")
-            return state.model_copy(deep=True), next_match_id
+        next_m = engine.activate_next()
+        if next_m != NO_MATCH:
+            next_match_id = table.match_id(next_m)
+            logger.debug(f"Next match activated: {next_match_id}")
+            audit_log.record(state.tournament_id, "match_activated", next_match_id)
+            return state, next_match_id
 
         # If no more matches, the tournament is over
-        if not state.bracket:
-            state.phase = TournamentPhase.FINALIZED
-            logger.info("Tournament Finalized: No matches were generated.")
-        elif all(m.status == MatchStatus.COMPLETE for m in state.bracket.values()):
+        if table.is_finished():
+            final = table.final_match
             state.phase = TournamentPhase.FINALIZED
+            state.final_rankings = {
+                1: engine.player_ids[table.winner[final]],
+                2: engine.player_ids[table.loser(final)],
+            }
+            self.release_tournament(state.tournament_id)
             logger.info("Tournament Finalized: All bracket matches completed.")
+            audit_log.record(state.tournament_id, "tournament_finalized", champion_id=state.final_rankings[1])
         
-        return state.model_copy(deep=True), None
+        return state, None
+
+    def get_standings(self, state: TournamentStateModel) -> List[Tuple[int, str]]:
+        """
+        Returns (place, player_id) for every eliminated player and the champion.
+        Players knocked out in the same round share a place (e.g. both semi-final losers are 3rd).
+        """
+        table = state.bracket_table
+        if table is None or not table.published:
+            return []
+
+        # Standings read the table directly; no engine (and no MatchModel) is needed.
+        seeding = state.seeding
+        if table.num_players != len(seeding):
+            logger.error(f"Cannot rank tournament {state.tournament_id}: its seeding does not match the bracket.")
+            return []
+        eliminated = [
+            (table.round_no[m], seeding[table.loser(m)])
+            for m in range(table.num_matches) if table.status[m] == COMPLETE
+        ]
+        eliminated.sort(key=lambda entry: entry[0], reverse=True)
+
+        standings: List[Tuple[int, str]] = []
+        if table.is_finished():
+            standings.append((1, seeding[table.winner[table.final_match]]))
+
+        place, previous_round = 0, None
+        for position, (round_no, player_id) in enumerate(eliminated, start=len(standings) + 1):
+            if round_no != previous_round:
+                place, previous_round = position, round_no
+            standings.append((place, player_id))
+        return standings
 
 # Initialization for use across the application
 bracket_logic = BracketLogic()
@@ -0,0 +1,125 @@
+# core/bracket_table.py
+
+from array import array
+from typing import Any, Dict
+
+# --- STATUS CODES ---
+# Plain ints instead of MatchStatus so the hot paths never touch the Enum.
+PENDING = 0
+ACTIVE = 1
+COMPLETE = 2
+
+NO_PLAYER = -1
+NO_MATCH = -1
+
+# Per-match columns: name -> (array typecode, empty value), in serialization order.
+COLUMNS = {
+    "round_no": ('B', 0),
+    "team_a": ('i', NO_PLAYER),
+    "team_b": ('i', NO_PLAYER),
+    "winner": ('i', NO_PLAYER),
+    "status": ('b', PENDING),
+    "next_match": ('i', NO_MATCH),
+    "next_slot": ('b', 0),
+}
+
+class BracketTable:
+    """
+    Compact store of a single-elimination bracket: the authoritative copy kept in
+    ``TournamentStateModel.bracket_table``.
+
+    Every match of the full tree is one row, held column-wise in ``array``s (about 20 bytes
+    per match); players are indexes into the tournament's seeding. A match is published
+    (visible as a MatchModel) once both of its teams are known. ``published`` lists those
+    rows in the order they became visible and ``active`` is the row being played.
+    """
+
+    __slots__ = ("num_players", "published", "active") + tuple(COLUMNS)
+
+    def __init__(self, num_players: int, num_matches: int):
+        self.num_players = num_players
+        self.published = array('i')
+        self.active = NO_MATCH
+        for name, (typecode, empty) in COLUMNS.items():
+            setattr(self, name, array(typecode, [empty]) * num_matches)
+
+    @property
+    def num_matches(self) -> int:
+        return len(self.status)
+
+    @property
+    def final_match(self) -> int:
+        return self.num_matches - 1
+
+    def is_finished(self) -> bool:
+        """True once the final has been decided."""
+        return self.num_matches > 0 and self.status[self.final_match] == COMPLETE
+
+    def is_published(self, m: int) -> bool:
+        return self.team_a[m] != NO_PLAYER and self.team_b[m] != NO_PLAYER
+
+    def loser(self, m: int) -> int:
+        """Index of the losing player of a completed match, or NO_PLAYER."""
+        if self.winner[m] == NO_PLAYER:
+            return NO_PLAYER
+        return self.team_b[m] if self.winner[m] == self.team_a[m] else self.team_a[m]
+
+    # --- MATCH IDS ---
+    # Ids are derived from the row, so none are stored: "M<row>".
+
+    @staticmethod
+    def match_id(m: int) -> str:
+        return f"M{m}"
+
+    def index_of(self, match_id: str) -> int:
+        """Row of a published match, or NO_MATCH for unknown or not-yet-published ids."""
+        try:
+            m = int(match_id[1:])
+        except (TypeError, ValueError):
+            return NO_MATCH
+        if self.match_id(m) != match_id or not 0 <= m < self.num_matches or not self.is_published(m):
+            return NO_MATCH
+        return m
+
+    # --- SERIALIZATION ---
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-friendly form of the table (plain lists of ints)."""
+        data: Dict[str, Any] = {"num_players": self.num_players, "active": self.active}
+        data.update((name, getattr(self, name).tolist()) for name in COLUMNS)
+        data["published"] = self.published.tolist()
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "BracketTable":
+        """Rebuilds a table from ``to_dict`` output. Raises ValueError if it is malformed or inconsistent."""
+        try:
+            table = cls(int(data["num_players"]), 0)
+            for name, (typecode, _) in COLUMNS.items():
+                setattr(table, name, array(typecode, data[name]))
+            table.published = array('i', data["published"])
+            table.active = int(data["active"])
+        except (KeyError, TypeError, OverflowError) as e:
+            raise ValueError(f"Malformed bracket table: {e!r}") from e
+        table.validate()
+        return table
+
+    def validate(self):
+        """Raises ValueError unless every column agrees with the others."""
+        n, players = self.num_matches, range(self.num_players)
+        if any(len(getattr(self, name)) != n for name in COLUMNS):
+            raise ValueError("Bracket table columns have different lengths.")
+        for m in range(n):
+            teams = (self.team_a[m], self.team_b[m])
+            if any(p != NO_PLAYER and p not in players for p in teams + (self.winner[m],)):
+                raise ValueError(f"Match {self.match_id(m)} refers to an unknown player.")
+            if self.status[m] not in (PENDING, ACTIVE, COMPLETE) or not -1 <= self.next_match[m] < n:
+                raise ValueError(f"Match {self.match_id(m)} has an invalid status or next match.")
+            if self.status[m] != PENDING and not self.is_published(m):
+                raise ValueError(f"Match {self.match_id(m)} was played without two teams.")
+            if self.winner[m] not in (teams if self.status[m] == COMPLETE else (NO_PLAYER,)):
+                raise ValueError(f"Match {self.match_id(m)} has an invalid winner.")
+        if sorted(self.published) != [m for m in range(n) if self.is_published(m)]:
+            raise ValueError("Bracket table publish order does not match its teams.")
+        if self.active != NO_MATCH and not (0 <= self.active < n and self.status[self.active] == ACTIVE):
+            raise ValueError("Bracket table's active match is not ACTIVE.")
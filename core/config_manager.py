@@ -1,6 +1,7 @@
 # core/config_manager.py
 
 import json
+import sys
 from pathlib import Path
 from typing import Optional
 from core.models import TournamentConfig
@@ -29,7 +30,8 @@ class ConfigManager:
     def load_config(self):
         """Loads the configuration from a JSON file, creating a default if none exists."""
         if not self.config_path.exists():
-            print(f"Configuration file not found at {self.config_path}. Creating default.")
+            # stderr, not stdout: the headless CLI reserves stdout for its JSON report
+            print(f"Configuration file not found at {self.config_path}. Creating default.", file=sys.stderr)
             self.config_path.parent.mkdir(exist_ok=True)
             self.config_path.write_text(DEFAULT_CONFIG)
             self._config = TournamentConfig()
@@ -40,7 +42,7 @@ class ConfigManager:
             # Pydantic validation happens here
             self._config = TournamentConfig.model_validate(config_data)
         except Exception as e:
-            print(f"Error loading config: {e}. Falling back to default configuration.")
+            print(f"Error loading config: {e}. Falling back to default configuration.", file=sys.stderr)
             self._config = TournamentConfig()
 
     def save_config(self):
@@ -23,7 +23,8 @@ def setup_logger():
         sys.stderr, 
         level="INFO", # Show INFO and above in the console for immediate feedback
         format="<green>{time:HH:mm:ss}</green> | {level} | {message}",
-        colorize=True
+        colorize=True,
+        enqueue=True # Keep terminal writes off the result-entry path too
     )
 
     # Add file sink using the configured level
@@ -1,9 +1,15 @@
 # core/models.py
 
-from pydantic import BaseModel, Field
-from typing import List, Dict, Optional
+from collections.abc import Mapping
+from pydantic import (
+    BaseModel, ConfigDict, Field, SerializationInfo, field_serializer, field_validator,
+    model_serializer, model_validator
+)
+from typing import Iterator, List, Dict, Optional
 from enum import Enum
 
+from core.bracket_table import BracketTable, NO_MATCH, NO_PLAYER
+
 # --- ENUMERATIONS ---
 
 class MatchStatus(str, Enum):
@@ -36,9 +42,16 @@ class SidePotModel(BaseModel):
 class TournamentConfig(BaseModel):
     """The main configuration for the BracketLab instance."""
     logging_level: str = Field("DEBUG", description="Logging level for Loguru (DEBUG, INFO, etc).")
+    audit_enabled: bool = Field(True, description="Write per-tournament audit streams to logs/audit.")
+    audit_queue_size: int = Field(10000, gt=0, description="Max queued audit records before producers block.")
+    audit_batch_size: int = Field(500, gt=0, description="Max audit records written per batch.")
     entry_fee_per_person: float = Field(5.0, ge=0, description="Default tournament entry fee.")
     min_players: int = Field(4, gt=0, description="Minimum number of players to start.")
     max_players: int = Field(32, gt=0, description="Maximum number of players.")
+    payout_percentages: List[float] = Field(
+        [70.0, 30.0],
+        description="Share of the prize pool (percent) paid to each finishing place, 1st first."
+    )
     
     side_pots_enabled: bool = True
     side_pots: List[SidePotModel] = Field(
@@ -56,14 +69,107 @@ class MatchModel(BaseModel):
     loser_id: Optional[str] = None
     score: Optional[Dict[str, int]] = None
 
+# Engine status codes (list position) -> MatchStatus
+STATUS_FROM_CODE = (MatchStatus.PENDING, MatchStatus.ACTIVE, MatchStatus.COMPLETE)
+
+class BracketView(Mapping):
+    """
+    Read-only map of match_id to MatchModel over a BracketTable.
+    Models are built on access and are snapshots: later results do not update them.
+    """
+
+    __slots__ = ("_table", "_seeding")
+
+    def __init__(self, table: Optional[BracketTable], seeding: List[str]):
+        self._table = table
+        self._seeding = seeding
+
+    def match(self, m: int) -> MatchModel:
+        """Builds the MatchModel for a published row of the table."""
+        table, seeding = self._table, self._seeding
+        winner, loser = table.winner[m], table.loser(m)
+        return MatchModel(
+            match_id=table.match_id(m),
+            round_name=f"Round {table.round_no[m]}",
+            teams=[seeding[table.team_a[m]], seeding[table.team_b[m]]],
+            status=STATUS_FROM_CODE[table.status[m]],
+            winner_id=seeding[winner] if winner != NO_PLAYER else None,
+            loser_id=seeding[loser] if loser != NO_PLAYER else None,
+        )
+
+    def _index_of(self, match_id: str) -> int:
+        return self._table.index_of(match_id) if self._table is not None else NO_MATCH
+
+    def __getitem__(self, match_id: str) -> MatchModel:
+        m = self._index_of(match_id)
+        if m == NO_MATCH:
+            raise KeyError(match_id)
+        return self.match(m)
+
+    def __contains__(self, match_id: object) -> bool:
+        return self._index_of(match_id) != NO_MATCH
+
+    def __iter__(self) -> Iterator[str]:
+        """Match ids in the order the matches were published."""
+        if self._table is not None:
+            yield from map(self._table.match_id, self._table.published)
+
+    def __reversed__(self) -> Iterator[str]:
+        if self._table is not None:
+            yield from map(self._table.match_id, reversed(self._table.published))
+
+    def __len__(self) -> int:
+        return len(self._table.published) if self._table is not None else 0
+
 class TournamentStateModel(BaseModel):
     """The CENTRAL, decoupled state of the entire active tournament."""
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     tournament_id: str = Field(..., description="Unique ID for this tournament instance.")
     name: str = Field(..., description="Name of the tournament.")
     phase: TournamentPhase = TournamentPhase.REGISTRATION
     
     players: Dict[str, PlayerModel] = Field(default_factory=dict, description="Map of player_id to PlayerModel.")
-    bracket: Dict[str, MatchModel] = Field(default_factory=dict, description="Map of match_id to MatchModel.")
+    seeding: List[str] = Field(default_factory=list, description="Player IDs in draw order (bye players first).")
+    bracket_table: Optional[BracketTable] = Field(None, description="Compact match table; the authoritative bracket.")
     
     total_prize_pool: float = 0.0
     final_rankings: Dict[int, str] = Field(default_factory=dict, description="Final rank -> Player ID.")
+
+    @property
+    def bracket(self) -> BracketView:
+        """Map of match_id to MatchModel for every published match, built on demand from the table."""
+        return BracketView(self.bracket_table, self.seeding)
+
+    def active_match(self) -> Optional[MatchModel]:
+        """The match currently being played, if any."""
+        table = self.bracket_table
+        if table is None or table.active == NO_MATCH:
+            return None
+        return self.bracket.match(table.active)
+
+    @field_validator("bracket_table", mode="before")
+    @classmethod
+    def _load_bracket_table(cls, value):
+        return BracketTable.from_dict(value) if isinstance(value, dict) else value
+
+    @field_serializer("bracket_table")
+    def _dump_bracket_table(self, table: Optional[BracketTable]):
+        return table.to_dict() if table is not None else None
+
+    @model_validator(mode="after")
+    def _check_seeding(self):
+        if self.bracket_table is not None and self.bracket_table.num_players != len(self.seeding):
+            raise ValueError(
+                f"Bracket was drawn for {self.bracket_table.num_players} players "
+                f"but the seeding lists {len(self.seeding)}."
+            )
+        return self
+
+    @model_serializer(mode="wrap")
+    def _dump_with_bracket(self, handler, info: SerializationInfo):
+        # Saved states stay human-readable: the published matches are written out as
+        # MatchModels next to the table, and ignored again when the state is loaded.
+        data = handler(self)
+        data["bracket"] = {m_id: m.model_dump(mode=info.mode) for m_id, m in self.bracket.items()}
+        return data
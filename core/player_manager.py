@@ -33,7 +33,7 @@ class PlayerManager:
         # 3. Store the player
         self._players[player_id] = new_player
         
-        logger.info(f"Registered new player: {name} with ID: {player_id[:8]}...")
+        logger.debug(f"Registered new player: {name} with ID: {player_id[:8]}...")
         return new_player
 
     def get_player(self, player_id: str) -> Optional[PlayerModel]:
@@ -0,0 +1,31 @@
+# core/prize_logic.py
+
+from itertools import groupby
+from typing import Dict, List, Tuple
+
+from core.models import TournamentStateModel
+from core.config_manager import config_manager
+
+class PrizeLogic:
+    """Splits the tournament prize pool across final standings."""
+
+    def compute_payouts(self, state: TournamentStateModel, standings: List[Tuple[int, str]]) -> Dict[str, float]:
+        """
+        Returns player_id -> payout amount using the configured payout percentages.
+        Players sharing a place split the shares of every position they cover.
+        """
+        percentages = config_manager.config.payout_percentages
+        payouts: Dict[str, float] = {}
+
+        for place, group in groupby(standings, key=lambda entry: entry[0]):
+            player_ids = [player_id for _, player_id in group]
+            share = sum(percentages[place - 1:place - 1 + len(player_ids)]) / len(player_ids)
+            if share <= 0:
+                continue
+            for player_id in player_ids:
+                payouts[player_id] = round(state.total_prize_pool * share / 100, 2)
+
+        return payouts
+
+# Initialization for use across the application
+prize_logic = PrizeLogic()
@@ -12,7 +12,7 @@ from PyQt6.QtCore import Qt
 # Import your core logic and models
 from core.bracket_logic import bracket_logic
 from core.player_manager import player_manager
-from core.models import TournamentStateModel, PlayerModel, TournamentPhase, MatchStatus
+from core.models import TournamentStateModel, PlayerModel, TournamentPhase
 from core.logger import logger
 from typing import List, Optional
 
@@ -174,7 +174,7 @@ class TournamentApp(QMainWindow):
         
         if self.current_state.phase == TournamentPhase.IN_PROGRESS:
             # Find the currently active match
-            active_match = next((m for m in self.current_state.bracket.values() if m.status == MatchStatus.ACTIVE), None)
+            active_match = self.current_state.active_match()
             
             if active_match:
                 team_names = [self.current_state.players.get(p_id).name for p_id in active_match.teams]
@@ -237,7 +237,7 @@ class TournamentApp(QMainWindow):
         winner_id = self.winner_input.text().strip()
         
         # Find the active match ID
-        active_match = next((m for m in self.current_state.bracket.values() if m.status == MatchStatus.ACTIVE), None)
+        active_match = self.current_state.active_match()
         
         if not active_match:
             logger.warning("No active match found to record a result.")
@@ -0,0 +1,358 @@
+# tests/bracket_harness.py
+
+import random
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from itertools import islice
+from math import ceil, log2
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+from core.config_manager import config_manager
+from core.models import (
+    TournamentStateModel, MatchModel, MatchStatus, TournamentPhase, PlayerModel
+)
+
+# Result actions: pick team 0 / team 1 of the active match, or first try an invalid result.
+TEAM_A, TEAM_B, INVALID_THEN_A = 0, 1, 2
+
+@contextmanager
+def player_limits(min_players: int, max_players: int):
+    """Temporarily widens the configured player range (restored afterwards)."""
+    config = config_manager.config
+    saved = (config.min_players, config.max_players)
+    config.min_players, config.max_players = min_players, max_players
+    try:
+        yield
+    finally:
+        config.min_players, config.max_players = saved
+
+def make_state(player_ids: Sequence[str]) -> Tuple[TournamentStateModel, List[PlayerModel]]:
+    """Builds a fresh REGISTRATION state for the given roster."""
+    players = [PlayerModel(player_id=p_id, name=f"Player {p_id}") for p_id in player_ids]
+    state = TournamentStateModel(
+        tournament_id=str(uuid.uuid4()),
+        name="Harness Tourney",
+        players={p.player_id: p for p in players}
+    )
+    return state, players
+
+def round_number(match: MatchModel) -> int:
+    return int(match.round_name.rsplit(" ", 1)[-1])
+
+# --- REFERENCE IMPLEMENTATION ---
+
+@dataclass
+class ReferenceState:
+    """The parts of TournamentStateModel the harness reads, with ``bracket`` as a plain dict."""
+    tournament_id: str
+    seeding: List[str]
+    phase: TournamentPhase = TournamentPhase.IN_PROGRESS
+    total_prize_pool: float = 0.0
+    bracket: Dict[str, MatchModel] = field(default_factory=dict)
+    final_rankings: Dict[int, str] = field(default_factory=dict)
+
+class ReferenceBracketLogic:
+    """
+    Deliberately naive single-elimination bracket with the same public API as BracketLogic.
+
+    Every match is a plain dict in one list and every lookup is a linear scan, so it is
+    slow but easy to audit. Its matches are published into a ReferenceState rather than a
+    table, so it shares no storage code with the engine it is compared against.
+    """
+
+    def __init__(self):
+        self._matches: Dict[str, List[dict]] = {}
+
+    def start_tournament(self, state: TournamentStateModel, players: List[PlayerModel]) -> ReferenceState:
+        num_players = len(players)
+        config = config_manager.config
+        if not (config.min_players <= num_players <= config.max_players):
+            state.phase = TournamentPhase.REGISTRATION
+            return state
+
+        player_ids = [p.player_id for p in players]
+        random.shuffle(player_ids)
+        state = ReferenceState(
+            state.tournament_id, player_ids, total_prize_pool=num_players * config.entry_fee_per_person
+        )
+
+        bracket_size = 2 ** ceil(log2(num_players))
+        num_byes = bracket_size - num_players
+        positions = bracket_size // 2
+        # Real Round 1 matches take the even positions first, byes fill the rest.
+        order = list(range(0, positions, 2)) + list(range(1, positions, 2))
+        bye_players, match_players = player_ids[:num_byes], player_ids[num_byes:]
+
+        matches = []
+        for k, position in enumerate(order[:positions - num_byes]):
+            matches.append(self._new_match(1, k, position, match_players[2 * k:2 * k + 2]))
+        round_no, size = 2, positions // 2
+        while size >= 1:
+            matches.extend(self._new_match(round_no, j, j, [None, None]) for j in range(size))
+            round_no, size = round_no + 1, size // 2
+        for player, position in zip(bye_players, order[positions - num_byes:]):
+            self._find(matches, 2, position // 2)["teams"][position % 2] = player
+
+        self._matches[state.tournament_id] = matches
+        self._sync(state, matches)
+        self._activate_next(state, matches)
+        return state
+
+    def record_match_result(self, state: ReferenceState, match_id: str, winner_id: str) -> Tuple[ReferenceState, Optional[str]]:
+        matches = self._matches.get(state.tournament_id, [])
+        match = next((m for m in matches if m["id"] == match_id), None)
+        if match is None or match["status"] != MatchStatus.ACTIVE or winner_id not in match["teams"]:
+            return state, None
+
+        match["status"] = MatchStatus.COMPLETE
+        match["winner"] = winner_id
+        parent = self._find(matches, match["round"] + 1, match["position"] // 2)
+        if parent is not None:
+            parent["teams"][match["position"] % 2] = winner_id
+        self._sync(state, matches)
+
+        next_id = self._activate_next(state, matches)
+        if next_id is None and all(m["status"] == MatchStatus.COMPLETE for m in matches):
+            final = matches[-1]
+            state.phase = TournamentPhase.FINALIZED
+            state.final_rankings = {1: final["winner"], 2: self._loser(final)}
+        return state, next_id
+
+    @staticmethod
+    def _new_match(round_no: int, order: int, position: int, teams: List[Optional[str]]) -> dict:
+        return {"id": None, "round": round_no, "order": order, "position": position,
+                "teams": list(teams), "status": MatchStatus.PENDING, "winner": None}
+
+    @staticmethod
+    def _find(matches: List[dict], round_no: int, position: int) -> Optional[dict]:
+        return next((m for m in matches if m["round"] == round_no and m["position"] == position), None)
+
+    @staticmethod
+    def _loser(match: dict) -> Optional[str]:
+        if match["winner"] is None:
+            return None
+        return next(p for p in match["teams"] if p != match["winner"])
+
+    def _sync(self, state: ReferenceState, matches: List[dict]):
+        """Publishes every match whose two teams are known, in (round, order) order."""
+        for m in sorted(matches, key=lambda m: (m["round"], m["order"])):
+            if None in m["teams"]:
+                continue
+            if m["id"] is None:
+                m["id"] = str(uuid.uuid4())
+            state.bracket[m["id"]] = MatchModel(
+                match_id=m["id"], round_name=f"Round {m['round']}", teams=list(m["teams"]),
+                status=m["status"], winner_id=m["winner"], loser_id=self._loser(m)
+            )
+
+    def _activate_next(self, state: ReferenceState, matches: List[dict]) -> Optional[str]:
+        for m in sorted(matches, key=lambda m: (m["round"], m["order"])):
+            if m["status"] == MatchStatus.PENDING and None not in m["teams"]:
+                m["status"] = MatchStatus.ACTIVE
+                state.bracket[m["id"]].status = MatchStatus.ACTIVE
+                return m["id"]
+        return None
+
+# --- INVARIANT CHECKER ---
+
+class BracketInvariants:
+    """
+    Checks bracket invariants after every step of a tournament.
+
+    Only the public TournamentStateModel is inspected, so any implementation of the
+    BracketLogic API can be checked. Bookkeeping is incremental (only the matches a step
+    touched are inspected), so it stays linear over thousands of players.
+    """
+
+    def __init__(self, state: TournamentStateModel, players: List[PlayerModel]):
+        self.num_players = len(players)
+        self.bracket_size = 2 ** ceil(log2(self.num_players))
+        self.num_byes = self.bracket_size - self.num_players
+        self.last_round = round(log2(self.bracket_size))
+        self.open_by_player: Dict[str, Set[str]] = {p.player_id: set() for p in players}
+        # Players owed exactly one slot, mapped to the round that slot must be in.
+        self.waiting: Dict[str, int] = {}
+        self.seen = 0
+        self.finalized_count = 0
+        self.active_id: Optional[str] = None
+
+        assert state.phase == TournamentPhase.IN_PROGRESS
+        assert sorted(state.seeding) == sorted(self.open_by_player)
+
+        # Byes: exactly the first num_byes seeds skip Round 1, and Round 1 holds everyone else.
+        bye_players = set(state.seeding[:self.num_byes])
+        round_one = [m for m in state.bracket.values() if round_number(m) == 1]
+        assert len(round_one) == (self.num_players - self.num_byes) // 2
+        assert not bye_players & {p for m in round_one for p in m.teams}
+        for m in state.bracket.values():
+            if round_number(m) != 1:
+                assert round_number(m) == 2 and set(m.teams) <= bye_players
+        self.waiting = {p_id: 2 for p_id in bye_players}
+
+        self._absorb_new_matches(state, initial=True)
+        active = [m_id for m_id, m in state.bracket.items() if m.status == MatchStatus.ACTIVE]
+        assert len(active) == 1
+        self.active_id = active[0]
+
+    def _absorb_new_matches(self, state: TournamentStateModel, initial: bool = False):
+        """
+        Registers matches published since the last step. A player may have at most one open
+        match, and (outside Round 1) may only appear to fill a slot they are owed.
+        """
+        new_count = len(state.bracket) - self.seen
+        assert new_count >= 0
+        for m_id in islice(reversed(state.bracket), new_count):
+            m = state.bracket[m_id]
+            assert m.status in (MatchStatus.PENDING, MatchStatus.ACTIVE)
+            assert len(set(m.teams)) == 2
+            for p_id in m.teams:
+                self.open_by_player[p_id].add(m.match_id)
+                assert len(self.open_by_player[p_id]) == 1, f"{p_id} is in two open matches"
+                if initial and round_number(m) == 1:
+                    continue
+                owed_round = self.waiting.pop(p_id, None)
+                assert owed_round == round_number(m), (
+                    f"{p_id} placed in {m.round_name} but was owed a slot in round {owed_round}"
+                )
+        self.seen = len(state.bracket)
+
+    def after_rejected(self, state: TournamentStateModel, snapshot: Tuple):
+        """An invalid result must leave the state untouched."""
+        assert self.snapshot(state) == snapshot
+
+    def snapshot(self, state: TournamentStateModel) -> Tuple:
+        active = state.bracket.get(self.active_id) if self.active_id else None
+        return state.phase, len(state.bracket), active.status if active else None
+
+    def after_result(self, state: TournamentStateModel, match_id: str, winner_id: str, next_id: Optional[str]):
+        """Checks one accepted result."""
+        match = state.bracket[match_id]
+        assert match_id == self.active_id
+        assert match.status == MatchStatus.COMPLETE
+        assert match.winner_id == winner_id and match.loser_id in match.teams and match.loser_id != winner_id
+
+        for p_id in match.teams:
+            self.open_by_player[p_id].discard(match_id)
+
+        # The winner is owed exactly one slot in the next round (filled now or once the
+        # opponent is known); the final's winner is owed nothing.
+        if round_number(match) == self.last_round:
+            assert state.phase == TournamentPhase.FINALIZED
+        else:
+            assert winner_id not in self.waiting
+            self.waiting[winner_id] = round_number(match) + 1
+
+        self._absorb_new_matches(state)
+        assert not self.open_by_player[match.loser_id]
+
+        # Exactly one active match while in progress; none once finalized.
+        if next_id is None:
+            assert state.phase == TournamentPhase.FINALIZED
+            self.finalized_count += 1
+        else:
+            assert state.phase == TournamentPhase.IN_PROGRESS
+            assert state.bracket[next_id].status == MatchStatus.ACTIVE
+            assert next_id in self.open_by_player[state.bracket[next_id].teams[0]]
+        self.active_id = next_id
+
+    def finish(self, state: TournamentStateModel):
+        """Checks the completed tournament as a whole."""
+        assert state.phase == TournamentPhase.FINALIZED
+        assert self.finalized_count == 1
+        assert not self.waiting
+        assert len(state.bracket) == self.num_players - 1
+        assert all(m.status == MatchStatus.COMPLETE for m in state.bracket.values())
+
+        losses: Dict[str, int] = {}
+        for m in state.bracket.values():
+            losses[m.loser_id] = losses.get(m.loser_id, 0) + 1
+        champion = state.final_rankings[1]
+        assert champion not in losses
+        assert len(losses) == self.num_players - 1 and set(losses.values()) == {1}
+
+        # Every non-final winner shows up in exactly one match of the following round.
+        rounds_played: Dict[str, List[int]] = {}
+        for m in state.bracket.values():
+            for p_id in m.teams:
+                rounds_played.setdefault(p_id, []).append(round_number(m))
+        for m in state.bracket.values():
+            if round_number(m) == self.last_round:
+                assert state.final_rankings == {1: m.winner_id, 2: m.loser_id}
+            else:
+                assert rounds_played[m.winner_id].count(round_number(m) + 1) == 1
+
+# --- DRIVERS ---
+
+def play_tournament(logic, player_ids: Sequence[str], seed: int, actions: Sequence[int],
+                    on_step: Optional[Callable] = None) -> TournamentStateModel:
+    """
+    Runs a full tournament with ``logic``, checking invariants after every step.
+    ``actions`` are cycled to choose each result (see TEAM_A / TEAM_B / INVALID_THEN_A).
+    """
+    state, players = make_state(player_ids)
+    random.seed(seed)
+    state = logic.start_tournament(state, players)
+    checker = BracketInvariants(state, players)
+
+    step = 0
+    while state.phase == TournamentPhase.IN_PROGRESS:
+        match_id = checker.active_id
+        match = state.bracket[match_id]
+        action = actions[step % len(actions)] if actions else TEAM_A
+
+        if action == INVALID_THEN_A:
+            snapshot = checker.snapshot(state)
+            outsider = next((p for p in player_ids if p not in match.teams), None)
+            if outsider is not None:
+                state, rejected = logic.record_match_result(state, match_id, outsider)
+                assert rejected is None
+                checker.after_rejected(state, snapshot)
+            action = TEAM_A
+
+        winner_id = match.teams[action]
+        state, next_id = logic.record_match_result(state, match_id, winner_id)
+        checker.after_result(state, match_id, winner_id, next_id)
+        if on_step:
+            on_step(step, state, match_id, next_id)
+        step += 1
+
+    # Replaying a result after the final must not finalize (or change) anything again.
+    final_id = next(reversed(state.bracket))
+    snapshot = checker.snapshot(state)
+    state, next_id = logic.record_match_result(state, final_id, state.final_rankings[1])
+    assert next_id is None
+    checker.after_rejected(state, snapshot)
+
+    checker.finish(state)
+    return state
+
+def canonical_bracket(state: TournamentStateModel) -> List[Tuple]:
+    """Implementation-independent view of the bracket (match IDs are random)."""
+    return [
+        (m.round_name, tuple(m.teams), m.status, m.winner_id, m.loser_id)
+        for m in state.bracket.values()
+    ]
+
+def run_differential(candidate, reference, player_ids: Sequence[str], seed: int, actions: Sequence[int]):
+    """
+    Plays the same roster, seed and results through two implementations and asserts
+    they publish the same active match after every step and the same final bracket.
+    """
+    traces: List[List[Tuple]] = []
+    finals = []
+    for logic in (candidate, reference):
+        trace: List[Tuple] = []
+
+        def on_step(step, state, match_id, next_id, trace=trace):
+            nxt = state.bracket[next_id] if next_id else None
+            trace.append((state.bracket[match_id].winner_id, len(state.bracket), state.phase,
+                          (nxt.round_name, tuple(nxt.teams)) if nxt else None))
+
+        finals.append(play_tournament(logic, player_ids, seed, actions, on_step=on_step))
+        traces.append(trace)
+
+    assert traces[0] == traces[1]
+    assert canonical_bracket(finals[0]) == canonical_bracket(finals[1])
+    assert finals[0].final_rankings == finals[1].final_rankings
+    assert finals[0].seeding == finals[1].seeding
@@ -0,0 +1,15 @@
+# tests/conftest.py
+
+import pytest
+
+from core.audit_log import audit_log
+
+@pytest.fixture(scope="session", autouse=True)
+def session_audit_log(tmp_path_factory):
+    """Points the global audit_log at a temporary directory so tests never write to ./logs/audit."""
+    original_dir = audit_log.audit_dir
+    audit_log.close()
+    audit_log.audit_dir = tmp_path_factory.mktemp("audit")
+    yield audit_log
+    audit_log.close()
+    audit_log.audit_dir = original_dir
@@ -0,0 +1,106 @@
+# tests/test_audit_log.py
+
+import gzip
+import threading
+import uuid
+
+import pytest
+
+from core.audit_log import AuditLog
+from core.config_manager import config_manager
+from core.bracket_logic import BracketLogic
+from core.models import TournamentStateModel, PlayerModel, MatchStatus
+
+@pytest.fixture
+def temp_audit_log(tmp_path):
+    """Provides an AuditLog isolated to a temporary directory, with tiny batches and segments."""
+    log = AuditLog(audit_dir=tmp_path, queue_size=16, batch_size=4, rotation_bytes=2048)
+    yield log
+    log.close()
+
+def test_query_filters_by_tournament_and_match(temp_audit_log):
+    """Tests that records land in per-tournament streams and can be filtered by match."""
+    for i in range(10):
+        temp_audit_log.record("T1", "match_completed", f"M{i % 2}", winner_id=f"P{i}")
+    temp_audit_log.record("T2", "tournament_started", players=8)
+    
+    assert len(temp_audit_log.query("T1")) == 10
+    assert [r["winner_id"] for r in temp_audit_log.query("T1", match_id="M1")] == ["P1", "P3", "P5", "P7", "P9"]
+    assert temp_audit_log.query("T2", event="tournament_started")[0]["players"] == 8
+
+def test_rotated_segments_are_compressed_and_still_queryable(temp_audit_log, tmp_path):
+    """Tests that large streams rotate into gzipped segments without losing or reordering records."""
+    for i in range(200): # well past the queue size, so producers hit backpressure
+        temp_audit_log.record("T1", "match_completed", f"M{i}", seq=i)
+    temp_audit_log.close()
+    
+    segments = sorted(tmp_path.glob("T1.*.jsonl.gz"))
+    assert segments
+    with gzip.open(segments[0], 'rt') as stream:
+        assert '"seq": 0' in stream.readline()
+    assert [r["seq"] for r in temp_audit_log.query("T1")] == list(range(200))
+
+def test_query_during_rotation_never_skips_segments(temp_audit_log):
+    """Tests that a query racing the writer's rotation returns a gap-free prefix of the stream."""
+    producer = threading.Thread(
+        target=lambda: [temp_audit_log.record("T1", "match_completed", f"M{i}", seq=i) for i in range(600)]
+    )
+    producer.start()
+    while producer.is_alive():
+        seqs = [r["seq"] for r in temp_audit_log.query("T1")]
+        assert seqs == list(range(len(seqs)))
+    producer.join()
+    assert len(temp_audit_log.query("T1")) == 600
+
+@pytest.mark.parametrize("tournament_id", ["../T1", "T1/x", "T1.x", "T*", ""])
+def test_unsafe_tournament_ids_are_rejected(temp_audit_log, tournament_id):
+    """Tests that ids which could escape the audit dir or match another stream's segments are refused."""
+    with pytest.raises(ValueError):
+        temp_audit_log.record(tournament_id, "tournament_started")
+    with pytest.raises(ValueError):
+        temp_audit_log.query(tournament_id)
+
+def test_bracket_logic_writes_audit_stream(session_audit_log):
+    """Tests that starting a tournament and recording a result are audited per match."""
+    players = [PlayerModel(player_id=f"P{i}", name=f"Player {i}") for i in range(1, 5)]
+    state = TournamentStateModel(
+        tournament_id=str(uuid.uuid4()),
+        name="Audited Tourney",
+        players={p.player_id: p for p in players}
+    )
+    logic = BracketLogic()
+    state = logic.start_tournament(state, players)
+    
+    match = next(m for m in state.bracket.values() if m.status == MatchStatus.ACTIVE)
+    state, _ = logic.record_match_result(state, match.match_id, match.teams[1])
+    
+    events = [r["event"] for r in session_audit_log.query(state.tournament_id)]
+    assert events == ["tournament_started", "match_activated", "match_completed", "match_activated"]
+    completed = session_audit_log.query(state.tournament_id, match_id=match.match_id, event="match_completed")
+    assert completed[0]["winner_id"] == match.teams[1]
+    assert (session_audit_log.audit_dir / f"{state.tournament_id}.jsonl").exists()
+
+def test_settings_follow_config_when_writer_starts(tmp_path, monkeypatch):
+    """Tests that unset settings are read from the config at start, not at construction."""
+    log = AuditLog(audit_dir=tmp_path)
+    monkeypatch.setattr(config_manager.config, "audit_enabled", False)
+    log.record("T1", "tournament_started")
+    assert not log.is_enabled() and not list(tmp_path.iterdir())
+    
+    monkeypatch.setattr(config_manager.config, "audit_enabled", True)
+    monkeypatch.setattr(config_manager.config, "audit_queue_size", 7)
+    log.record("T1", "tournament_started")
+    assert log._queue.maxsize == 7
+    log.close()
+
+def test_writer_survives_failed_batch(temp_audit_log, monkeypatch):
+    """Tests that an unexpected error while writing does not hang flush() or stop later records."""
+    def broken_write(batch):
+        raise RuntimeError("disk on fire")
+    monkeypatch.setattr(temp_audit_log, "_write_batch", broken_write)
+    temp_audit_log.record("T1", "match_completed", "M1")
+    temp_audit_log.flush()
+    
+    monkeypatch.undo()
+    temp_audit_log.record("T1", "match_completed", "M2")
+    assert [r["match_id"] for r in temp_audit_log.query("T1")] == ["M2"]
@@ -0,0 +1,57 @@
+# tests/test_bracket_properties.py
+
+import pytest
+
+hypothesis = pytest.importorskip("hypothesis")
+from hypothesis import HealthCheck, given, settings, strategies as st
+
+from core.audit_log import audit_log
+from core.bracket_logic import BracketLogic
+from tests.bracket_harness import (
+    ReferenceBracketLogic, player_limits, play_tournament, run_differential,
+    TEAM_A, TEAM_B, INVALID_THEN_A
+)
+
+@pytest.fixture(scope="module", autouse=True)
+def audit_disabled():
+    """Keeps hundreds of generated tournaments off the audit writer and the disk."""
+    saved = audit_log.enabled
+    audit_log.enabled = False
+    yield
+    audit_log.enabled = saved
+
+# Any optimized engine exposing the BracketLogic API can be added here for differential runs.
+CANDIDATE_LOGICS = [BracketLogic]
+
+def rosters(min_size: int = 2, max_size: int = 64):
+    """Unique, arbitrary player IDs."""
+    return st.lists(st.text(min_size=1, max_size=8), min_size=min_size, max_size=max_size, unique=True)
+
+seeds = st.integers(min_value=0, max_value=2**32 - 1)
+actions = st.lists(st.sampled_from([TEAM_A, TEAM_B, INVALID_THEN_A]), max_size=32)
+
+@settings(max_examples=150, deadline=None)
+@given(player_ids=rosters(), seed=seeds, actions=actions)
+def test_bracket_invariants_hold_after_every_step(player_ids, seed, actions):
+    """Every step keeps one active match, advances winners into one slot and finalizes once."""
+    with player_limits(2, 64):
+        play_tournament(BracketLogic(), player_ids, seed, actions)
+
+@settings(max_examples=5, deadline=None, suppress_health_check=[HealthCheck.too_slow])
+@given(
+    num_players=st.one_of(st.integers(min_value=1000, max_value=4096), st.sampled_from([1024, 2048, 4096])),
+    seed=seeds,
+    actions=actions
+)
+def test_bracket_invariants_hold_at_scale(num_players, seed, actions):
+    """The same invariants on brackets with thousands of players (incremental checks only)."""
+    with player_limits(2, 4096):
+        play_tournament(BracketLogic(), [f"P{i}" for i in range(num_players)], seed, actions)
+
+@pytest.mark.parametrize("candidate", CANDIDATE_LOGICS)
+@settings(max_examples=100, deadline=None)
+@given(player_ids=rosters(max_size=96), seed=seeds, actions=actions)
+def test_engine_matches_reference_implementation(candidate, player_ids, seed, actions):
+    """Differential mode: the candidate publishes exactly what the naive reference does."""
+    with player_limits(2, 96):
+        run_differential(candidate(), ReferenceBracketLogic(), player_ids, seed, actions)
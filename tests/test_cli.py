@@ -0,0 +1,88 @@
+# tests/test_cli.py
+
+import json
+import os
+import random
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from cli import run_batch, run_tournament, run_tournament_dir, OUTPUT_FILE
+from core.config_manager import config_manager
+from core.models import TournamentStateModel
+from core.prize_logic import PrizeLogic
+
+@pytest.fixture
+def tournament_dir(tmp_path, monkeypatch):
+    """A 4-player tournament directory with a fixed draw (A-B, C-D) and a full set of results."""
+    monkeypatch.setattr(random, "shuffle", lambda ids: None)
+    (tmp_path / 'roster.json').write_text(json.dumps({"name": "Headless Cup", "players": ["A", "B", "C", "D"]}))
+    (tmp_path / 'results.json').write_text(json.dumps(["A", "C", {"winner": "A"}]))
+    return tmp_path
+
+def test_run_tournament_emits_standings_and_payouts(tournament_dir):
+    """Tests that a roster and results file produce final standings and a split prize pool."""
+    report = run_tournament(tournament_dir / 'roster.json', tournament_dir / 'results.json')
+    
+    assert report["phase"] == "FINALIZED"
+    assert report["matches_played"] == 3
+    assert [(s["place"], s["name"]) for s in report["standings"]] == [(1, "A"), (2, "C"), (3, "B"), (3, "D")]
+    assert {p["name"]: p["amount"] for p in report["payouts"]} == {"A": 14.0, "C": 6.0} # $20 pool, 70/30
+
+def test_run_tournament_rejects_result_for_wrong_player(tournament_dir):
+    """Tests that a winner who is not in the active match stops processing."""
+    (tournament_dir / 'results.json').write_text(json.dumps(["C"]))
+    
+    with pytest.raises(ValueError):
+        run_tournament(tournament_dir / 'roster.json', tournament_dir / 'results.json')
+
+def test_run_tournament_dir_writes_report(tournament_dir):
+    """Tests that the batch worker writes its standings next to the roster."""
+    summary = run_tournament_dir(tournament_dir)
+    
+    assert "error" not in summary
+    assert json.loads((tournament_dir / OUTPUT_FILE).read_text())["name"] == "Headless Cup"
+
+def test_run_batch_reports_bad_directory_alongside_good_ones(tmp_path):
+    """Tests that one malformed roster is reported as an error without aborting the batch."""
+    for name in ("cup_a", "cup_b", "cup_c"):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / 'roster.json').write_text(json.dumps(["A", "B", "C", "D"]))
+    (tmp_path / 'cup_b' / 'roster.json').write_text(json.dumps([1, 2, 3, 4]))
+    
+    reports = run_batch(tmp_path, workers=2)
+    
+    assert [Path(r["directory"]).name for r in reports] == ["cup_a", "cup_b", "cup_c"]
+    assert "invalid player entry" in reports[1]["error"]
+    assert all("error" not in reports[i] for i in (0, 2))
+    assert (tmp_path / 'cup_c' / OUTPUT_FILE).exists()
+
+def test_compute_payouts_splits_shared_places(monkeypatch):
+    """Tests that players tied on a place split the shares of the positions they cover."""
+    monkeypatch.setattr(config_manager.config, "payout_percentages", [50.0, 30.0, 12.0, 8.0])
+    state = TournamentStateModel(tournament_id="T", name="Payouts", total_prize_pool=100.0)
+    standings = [(1, "P1"), (2, "P2"), (3, "P3"), (3, "P4")]
+    
+    payouts = PrizeLogic().compute_payouts(state, standings)
+    
+    assert payouts == {"P1": 50.0, "P2": 30.0, "P3": 10.0, "P4": 10.0}
+
+def test_cli_does_not_import_qt():
+    """Tests that the headless entry point can be imported without PyQt6."""
+    code = "import sys, cli; sys.exit('PyQt6' in sys.modules)"
+    root = Path(__file__).resolve().parent.parent
+    assert subprocess.run([sys.executable, "-c", code], cwd=root).returncode == 0
+
+def test_cli_stdout_is_json_on_fresh_host(tmp_path):
+    """Tests that first-run config messages do not leak into the JSON report on stdout."""
+    (tmp_path / 'roster.json').write_text(json.dumps(["A", "B", "C", "D"]))
+    root = Path(__file__).resolve().parent.parent
+    result = subprocess.run(
+        [sys.executable, str(root / 'cli.py'), 'run', 'roster.json'],
+        cwd=tmp_path, capture_output=True, text=True, env={**os.environ, "PYTHONPATH": str(root)}
+    )
+    
+    assert result.returncode == 0
+    assert json.loads(result.stdout)["phase"] == "IN_PROGRESS"
@@ -1,15 +1,19 @@
 # tests/test_logic.py
 
+import copy
 import pytest
+import tracemalloc
 import uuid
 import json
 from pathlib import Path
+from pydantic import ValidationError
 from typing import Optional, List, Dict, Tuple
 from core.models import (
     TournamentStateModel, MatchModel, MatchStatus, TournamentPhase, PlayerModel
 )
 
-from core.config_manager import ConfigManager, DEFAULT_CONFIG_PATH
+from core.config_manager import ConfigManager, DEFAULT_CONFIG_PATH, config_manager
+from core.bracket_engine import BracketEngine
 from core.bracket_logic import BracketLogic
 from core.models import TournamentStateModel, PlayerModel, MatchStatus, TournamentPhase
 
@@ -102,3 +106,121 @@ def test_record_match_result_updates_status(initial_state_and_players):
     # 2. Assert next match is activated (the only other round 1 match)
     assert next_match_id is not None
     assert updated_state.bracket[next_match_id].status == MatchStatus.ACTIVE
+
+def _play_out(logic: BracketLogic, state: TournamentStateModel) -> TournamentStateModel:
+    """Plays every match to completion, always advancing the first listed team."""
+    while state.phase == TournamentPhase.IN_PROGRESS:
+        active_match = state.active_match()
+        state, _ = logic.record_match_result(state, active_match.match_id, active_match.teams[0])
+    return state
+
+def test_full_tournament_advances_winners_to_final(initial_state_and_players):
+    """Tests that winners (and bye players) advance round by round until a champion is crowned."""
+    state, players = initial_state_and_players
+    logic = BracketLogic()
+    state = logic.start_tournament(state, players)
+    
+    state = _play_out(logic, state)
+    
+    assert state.phase == TournamentPhase.FINALIZED
+    assert len(state.bracket) == 5 # 6 players -> 5 matches in single elimination
+    assert all(m.status == MatchStatus.COMPLETE for m in state.bracket.values())
+    
+    final_match = list(state.bracket.values())[-1]
+    assert final_match.round_name == "Round 3"
+    assert state.final_rankings == {1: final_match.winner_id, 2: final_match.loser_id}
+
+def test_record_match_result_rebuilds_engine_from_state(initial_state_and_players):
+    """Tests that a fresh BracketLogic can continue a tournament from its state model alone."""
+    state, players = initial_state_and_players
+    state = BracketLogic().start_tournament(state, players)
+    restored = TournamentStateModel.model_validate_json(state.model_dump_json())
+    
+    state = _play_out(BracketLogic(), restored)
+    
+    assert state.phase == TournamentPhase.FINALIZED
+    assert len(state.bracket) == 5
+
+def test_state_without_seeding_is_rejected(initial_state_and_players):
+    """Tests that a bracket without its seeding is refused on load, and with an error instead of a crash at runtime."""
+    state, players = initial_state_and_players
+    state = BracketLogic().start_tournament(state, players)
+    saved = state.model_dump()
+    del saved["seeding"]
+    with pytest.raises(ValidationError):
+        TournamentStateModel.model_validate(saved)
+    
+    logic = BracketLogic()
+    active_match = state.active_match()
+    state.seeding = []
+    updated_state, next_match_id = logic.record_match_result(state, active_match.match_id, active_match.teams[0])
+    
+    assert next_match_id is None
+    assert updated_state.bracket_table.active == updated_state.bracket_table.index_of(active_match.match_id)
+    assert logic.get_standings(state) == []
+
+def test_malformed_bracket_table_is_rejected(initial_state_and_players):
+    """Tests that a saved table whose columns disagree fails validation on load."""
+    state, players = initial_state_and_players
+    state = BracketLogic().start_tournament(state, players)
+    saved = state.model_dump(mode="json")
+    saved["bracket_table"]["winner"][0] = 5 # a player who is not in the match
+    
+    with pytest.raises(ValidationError):
+        TournamentStateModel.model_validate(saved)
+
+def test_evicted_engine_is_rebuilt_from_state(initial_state_and_players):
+    """Tests that engines beyond the cache cap are evicted and transparently rebuilt."""
+    state, players = initial_state_and_players
+    logic = BracketLogic(max_cached_engines=1)
+    state = logic.start_tournament(state, players)
+    
+    other_state = TournamentStateModel(tournament_id="other", name="Other", players=state.players)
+    logic.start_tournament(other_state, players)
+    assert list(logic._engines) == ["other"]
+    
+    state = _play_out(logic, state)
+    assert state.phase == TournamentPhase.FINALIZED
+    
+    logic.release_tournament("other")
+    assert not logic._engines
+
+def test_get_standings_does_not_rebuild_engine(initial_state_and_players, monkeypatch):
+    """Tests that standings for a live tournament are read from its table, not from a rebuilt engine."""
+    state, players = initial_state_and_players
+    logic = BracketLogic()
+    state = logic.start_tournament(state, players)
+    active_match = next(m for m in state.bracket.values() if m.status == MatchStatus.ACTIVE)
+    state, _ = logic.record_match_result(state, active_match.match_id, active_match.teams[0])
+    
+    def no_rebuild(state):
+        raise AssertionError("engine was rebuilt")
+    monkeypatch.setattr(BracketEngine, "from_state", no_rebuild)
+    
+    assert logic.get_standings(state) == [(1, active_match.teams[1])]
+
+def _traced_bytes(build):
+    """Bytes still allocated by ``build()`` while its result is alive."""
+    tracemalloc.start()
+    try:
+        result = build()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return size
+
+def test_bracket_table_is_far_smaller_than_match_models(monkeypatch):
+    """Tests that the stored bracket costs a fraction of keeping a MatchModel per match."""
+    players = [PlayerModel(player_id=f"P{i}", name=f"Player {i}") for i in range(1024)]
+    monkeypatch.setattr(config_manager.config, "max_players", 1024)
+    state = TournamentStateModel(tournament_id=str(uuid.uuid4()), name="Big", players={p.player_id: p for p in players})
+    logic = BracketLogic()
+    state = _play_out(logic, logic.start_tournament(state, players))
+    num_matches = len(state.bracket)
+    
+    table_bytes = _traced_bytes(lambda: copy.deepcopy(state.bracket_table)) / num_matches
+    model_bytes = _traced_bytes(lambda: dict(state.bracket.items())) / num_matches
+    
+    assert num_matches == 1023
+    assert table_bytes * 10 < model_bytes, (table_bytes, model_bytes)